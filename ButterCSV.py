@@ -8,10 +8,265 @@ import re
 import csv
 import configparser
 import os
+import json
+import math
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
 
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s:%(message)s')
 JAPANESE_CHAR_PATTERN = re.compile(r'[\u3040-\u30ff\u4e00-\u9faf\uff66-\uff9f]')
 THEME_FILE = "theme.ini"
+XLIFF_NS = "urn:oasis:names:tc:xliff:document:1.2"
+XML_INVALID_CHAR_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+COLOR_CODE_PATTERN = re.compile(r'‾C[0-9A-F]{2}')
+VARIABLE_TOKEN_PATTERN = re.compile(r'‾C[0-9A-F]{2}|\d+(?:[.,]\d+)*')
+TRAILING_PUNCT_PATTERN = re.compile(r'[\s.,!?…。、]+$')
+CLUSTER_THRESHOLD = 0.75
+PO_ESCAPES = {'\\': '\\\\', '"': '\\"', '\n': '\\n', '\t': '\\t', '\r': '\\r'}
+PO_UNESCAPES = {v[1]: k for k, v in PO_ESCAPES.items()}
+
+
+# Exchange formats: every writer takes an iterable of (source, target, occurrences)
+# where occurrences is a list of (row index, location), and writes it out one
+# entry at a time. Every reader yields (source, target) pairs while parsing.
+
+def write_xliff(path, entries):
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<xliff version="1.2" xmlns="{XLIFF_NS}">\n')
+        f.write(' <file original="ButterCSV" datatype="plaintext" source-language="ja" target-language="en">\n')
+        f.write('  <body>\n')
+        for count, (source, target, occurrences) in enumerate(entries, start=1):
+            f.write(f'   <trans-unit id="{count}" xml:space="preserve">\n')
+            f.write(f'    <source>{_xml_text(source)}</source>\n')
+            # Untranslated entries get an empty target, like translation tools expect
+            f.write(f'    <target>{_xml_text(target if target != source else "")}</target>\n')
+            for idx, location in occurrences:
+                f.write('    <context-group purpose="location">\n')
+                f.write(f'     <context context-type="x-location">{_xml_text(location)}</context>\n')
+                f.write(f'     <context context-type="linenumber">{idx + 1}</context>\n')
+                f.write('    </context-group>\n')
+            f.write('   </trans-unit>\n')
+        f.write('  </body>\n </file>\n</xliff>\n')
+    return count
+
+
+def read_xliff(path):
+    # Detach every finished unit from its parent so memory stays flat
+    parents = []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag.rsplit('}', 1)[-1] != 'trans-unit':
+            continue
+        source = elem.find(f'{{{XLIFF_NS}}}source')
+        target = elem.find(f'{{{XLIFF_NS}}}target')
+        if source is None:
+            source, target = elem.find('source'), elem.find('target')
+        if source is not None and target is not None:
+            yield _xml_untext(source), _xml_untext(target)
+        if parents:
+            parents[-1].remove(elem)
+
+
+def _xml_text(text):
+    # Escape CR too, XML parsers normalize a raw one into a newline. Control chars
+    # XML 1.0 can't carry at all become <x/> placeholders.
+    text = xml_escape(text, {'\r': '&#13;'})
+    return XML_INVALID_CHAR_PATTERN.sub(lambda m: f'<x id="cp" ctype="x-cp-{ord(m.group()):04X}"/>', text)
+
+
+def _xml_untext(elem):
+    parts = [elem.text or '']
+    for child in elem:
+        ctype = child.get('ctype', '')
+        if ctype.startswith('x-cp-'):
+            parts.append(chr(int(ctype[5:], 16)))
+        else:
+            parts.append(''.join(child.itertext()))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def write_po(path, entries):
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n')
+        for count, (source, target, occurrences) in enumerate(entries, start=1):
+            f.write(f"\n#. Entry {occurrences[0][0] + 1} ({len(occurrences)}x)\n" if occurrences else "\n")
+            for idx, location in occurrences:
+                f.write(f"#: {location}\n")
+            f.write(_po_field('msgid', source))
+            f.write(_po_field('msgstr', target if target != source else ""))
+    return count
+
+
+def read_po(path):
+    with open(path, encoding='utf-8') as f:
+        fields, current = {}, None
+        for raw in f:
+            line = raw.strip()
+            if line.startswith('"') and current:
+                fields[current] += _po_unquote(line)
+                continue
+            keyword = line.split(' ', 1)[0]
+            if keyword in ('msgctxt', 'msgid') and 'msgstr' in fields:
+                if fields.get('msgid'):
+                    yield fields['msgid'], fields['msgstr']
+                fields = {}
+            if keyword in ('msgctxt', 'msgid', 'msgstr'):
+                current = keyword
+                fields[current] = _po_unquote(line[len(keyword):].strip())
+            else:
+                current = None
+        if fields.get('msgid') and 'msgstr' in fields:
+            yield fields['msgid'], fields['msgstr']
+
+
+def _po_field(keyword, text):
+    chunks = re.findall(r'[^\n]*\n|[^\n]+', text)
+    if len(chunks) <= 1:
+        return f'{keyword} "{_po_escape(text)}"\n'
+    return f'{keyword} ""\n' + "".join(f'"{_po_escape(chunk)}"\n' for chunk in chunks)
+
+
+def _po_escape(text):
+    return re.sub(r'[\\"\n\t\r]', lambda m: PO_ESCAPES[m.group()], text)
+
+
+def _po_unquote(token):
+    return re.sub(r'\\(.)', lambda m: PO_UNESCAPES.get(m.group(1), m.group(1)), token[1:-1])
+
+
+def write_jsonl(path, entries):
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for count, (source, target, occurrences) in enumerate(entries, start=1):
+            record = {
+                "id": count,
+                "source": source,
+                "target": target,
+                "occurrences": [{"row": idx + 1, "location": location} for idx, location in occurrences]
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return count
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["source"], record["target"]
+
+
+# Near-duplicate clustering: entries are first grouped by a normalized signature
+# (numbers, color tags, case and trailing punctuation ignored), then the unique
+# signatures are merged through MinHash/LSH buckets over character 3-grams.
+
+def cluster_signature(text):
+    text = unicodedata.normalize('NFKC', COLOR_CODE_PATTERN.sub('', text)).lower()
+    text = re.sub(r'\d+(?:[.,]\d+)*', '#', text)
+    return " ".join(TRAILING_PUNCT_PATTERN.sub('', text).split())
+
+
+def cluster_keys(keys):
+    groups = {}
+    for key in keys:
+        groups.setdefault(cluster_signature(key), []).append(key)
+    signatures = list(groups)
+
+    # Bottom-k MinHash over a fixed rarest-first shingle order: every value of a
+    # signature's sketch is an LSH bucket. Two sets with Jaccard >= CLUSTER_THRESHOLD
+    # always share one of their first n - ceil(threshold * n) + 1 shingles, so the
+    # sketch stays a few values long, and rare shingles keep the buckets small.
+    # Only cluster leaders go into buckets and a signature joins a leader it is
+    # directly similar to, so clusters never grow by chaining A~B~C.
+    frequency = {}
+    for sig in signatures:
+        for shingle in _shingles(sig):
+            frequency[shingle] = frequency.get(shingle, 0) + 1
+
+    buckets = {}
+    sizes = []
+    clusters = {}
+    for i, sig in enumerate(signatures):
+        shingles = _shingles(sig)
+        sizes.append(len(shingles))
+        sketch = sorted(shingles, key=lambda shingle: (frequency[shingle], shingle))
+        sketch = sketch[:len(sketch) - math.ceil(CLUSTER_THRESHOLD * len(sketch)) + 1]
+        leader = None
+        checked = set()
+        for j in (j for h in sketch for j in buckets.get(h, ())):
+            if j in checked or CLUSTER_THRESHOLD * max(sizes[j], sizes[i]) > min(sizes[j], sizes[i]):
+                continue
+            checked.add(j)
+            other = _shingles(signatures[j])
+            if len(shingles & other) >= CLUSTER_THRESHOLD * len(shingles | other):
+                leader = j
+                break
+        if leader is None:
+            leader = i
+            for h in sketch:
+                buckets.setdefault(h, []).append(i)
+        clusters.setdefault(leader, []).append(groups[sig])
+    return list(clusters.values())
+
+
+def _shingles(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)} or {text}
+
+
+def template_pattern(text):
+    return VARIABLE_TOKEN_PATTERN.sub(lambda m: '\0T' if m.group().startswith('‾') else '\0N', text)
+
+
+def fill_template(template, template_source, target_source):
+    if template_pattern(template_source) != template_pattern(target_source):
+        return None
+    template_tokens = VARIABLE_TOKEN_PATTERN.findall(template_source)
+    target_tokens = VARIABLE_TOKEN_PATTERN.findall(target_source)
+
+    slots = {}
+    for template_tok, target_tok in zip(template_tokens, target_tokens):
+        slots.setdefault(_token_key(template_tok), []).append(target_tok)
+    used = {}
+
+    def substitute(match):
+        tok = match.group()
+        key = _token_key(tok)
+        options = slots.get(key)
+        if not options:
+            return tok
+        n = used[key] = used.get(key, -1) + 1
+        replacement = options[n % len(options)]
+        # Keep the translator's digit width, e.g. "１０" in the source but "10" in the edit
+        if tok.isascii() and not replacement.startswith('‾'):
+            replacement = unicodedata.normalize('NFKC', replacement)
+        return replacement
+
+    filled = VARIABLE_TOKEN_PATTERN.sub(substitute, template)
+    # Every number/tag of the source has to show up in the edit, otherwise the
+    # template would copy the representative's values onto the other lines
+    if any(used.get(key, -1) + 1 < len(options) for key, options in slots.items()):
+        return None
+    return filled
+
+
+def _token_key(tok):
+    return tok if tok.startswith('‾') else unicodedata.normalize('NFKC', tok)
+
+
+EXCHANGE_FORMATS = {
+    "xliff": ("XLIFF 1.2", ".xlf", write_xliff, read_xliff),
+    "po": ("Gettext PO", ".po", write_po, read_po),
+    "jsonl": ("JSON Lines", ".jsonl", write_jsonl, read_jsonl),
+}
 
 class CSVTranslationTool:
     def __init__(self, root):
@@ -33,6 +288,12 @@ class CSVTranslationTool:
         self.max_lines = 3
         self.ordered_keys = []
         self.list_mode = False
+        self.cluster_mode = False
+        self.clusters = {}
+        self.cluster_totals = {}
+        self.cluster_manual = {}
+        self.cluster_failed = {}
+        self.cluster_originals = {}
         self.min_duplicates_filter = 0
         self.sort_descending = True
         self.temp_save_path = "_autosave_translation_cache.csv"
@@ -125,6 +386,14 @@ class CSVTranslationTool:
         options_menu.add_command(label="Settings...", command=self.show_settings_view)
         self.menu_bar.add_cascade(label="Options", menu=options_menu)
 
+        export_menu = tk.Menu(self.menu_bar, tearoff=0)
+        import_menu = tk.Menu(self.menu_bar, tearoff=0)
+        for fmt, (label, _, _, _) in EXCHANGE_FORMATS.items():
+            export_menu.add_command(label=f"{label}...", command=lambda f=fmt: self.export_translations(f))
+            import_menu.add_command(label=f"{label}...", command=lambda f=fmt: self.import_translations(f))
+        self.menu_bar.add_cascade(label="Export", menu=export_menu)
+        self.menu_bar.add_cascade(label="Import", menu=import_menu)
+
         self.top_frame = ttk.Frame(self.root, style="TopBar.TFrame")
         self.top_frame.pack(side=tk.TOP, fill=tk.X, pady=10)
 
@@ -132,6 +401,7 @@ class CSVTranslationTool:
         self.save_button = ttk.Button(self.top_frame, text="Save & Rebuild CSV", command=self.save_and_rebuild)
         self.fallback_save_button = ttk.Button(self.top_frame, text="Manual Save", command=self.manual_save)
         self.toggle_list_button = ttk.Button(self.top_frame, text="Toggle List Mode", command=self.toggle_list_mode)
+        self.toggle_cluster_button = ttk.Button(self.top_frame, text="Toggle Cluster Mode", command=self.toggle_cluster_mode)
 
         self.filter_label = ttk.Label(self.top_frame, text="Min Duplicates:", style="Highlight.TLabel")
         self.filter_entry = ttk.Entry(self.top_frame, width=5)
@@ -139,7 +409,7 @@ class CSVTranslationTool:
         self.apply_filter_button = ttk.Button(self.top_frame, text="Apply Filter", command=self.apply_filter)
 
         for widget in [self.load_button, self.save_button, self.fallback_save_button,
-                       self.toggle_list_button, self.filter_label, self.filter_entry,
+                       self.toggle_list_button, self.toggle_cluster_button, self.filter_label, self.filter_entry,
                        self.sort_button, self.apply_filter_button]:
             widget.pack(side=tk.LEFT, padx=5)
 
@@ -224,7 +494,10 @@ class CSVTranslationTool:
                 issues = self.check_text_limits(content)
                 flag = f" ⚠ ({'; '.join(str(x) for x in issues)})" if issues else ""
                 true_index = self.reverse_map[key][0] + 1
-                label = f"____Entry {true_index}{flag}:\n"
+                if self.cluster_mode:
+                    label = f"____Entry {true_index} ({self.cluster_info(key)}){flag}:\n"
+                else:
+                    label = f"____Entry {true_index}{flag}:\n"
 
                 label_index = self.list_widget.index(tk.INSERT)
                 entry_tag = f"label_{i}"
@@ -261,7 +534,10 @@ class CSVTranslationTool:
                 issues = self.check_text_limits(content)
                 flag = f" ⚠ ({'; '.join(str(x) for x in issues)})" if issues else ""
                 true_index = self.reverse_map[key][0] + 1
-                label_text = f"Entry {true_index} ({len(self.reverse_map[key])}x){flag}:"
+                if self.cluster_mode:
+                    label_text = f"Entry {true_index} ({self.cluster_info(key)}){flag}:"
+                else:
+                    label_text = f"Entry {true_index} ({len(self.reverse_map[key])}x){flag}:"
                 lbl = ttk.Label(self.entries_frame, text=label_text)
                 lbl.pack(anchor='w', padx=5, pady=(5, 0))
 
@@ -291,9 +567,12 @@ class CSVTranslationTool:
         widget = event.widget
         widget.edit_modified(False)
         content = widget.get("1.0", tk.END).strip()
-        self.deduped_map[key] = content
+        self.update_entry(key, content)
         issues = self.check_text_limits(content)
-        if issues:
+        if self.cluster_mode:
+            flag = f" ⚠ ({'; '.join(issues)})" if issues else ""
+            label.config(text=f"Entry {self.reverse_map[key][0] + 1} ({self.cluster_info(key)}){flag}:")
+        elif issues:
             label.config(text=f"{label.cget('text').split(' ⚠')[0]} ⚠ ({'; '.join(issues)})")
         else:
             label.config(text=label.cget('text').split(' ⚠')[0])
@@ -342,11 +621,14 @@ class CSVTranslationTool:
             body_end = f"{label_line_indices[target_idx + 1][0]}.0" if target_idx + 1 < len(label_line_indices) else tk.END
             body = self.list_widget.get(body_start, body_end).strip()
 
-            self.deduped_map[key] = body
+            self.update_entry(key, body)
             issues = self.check_text_limits(body)
             flag = f" ⚠ ({'; '.join(issues)})" if issues else ""
             true_index = self.reverse_map[key][0] + 1
-            new_label = f"____Entry {true_index}{flag}:"
+            if self.cluster_mode:
+                new_label = f"____Entry {true_index} ({self.cluster_info(key)}){flag}:"
+            else:
+                new_label = f"____Entry {true_index}{flag}:"
 
             self.list_widget.delete(f"{label_line}.0", f"{label_line}.end")
             self.list_widget.insert(f"{label_line}.0", new_label)
@@ -510,6 +792,67 @@ class CSVTranslationTool:
         self.list_mode = not self.list_mode
         self.refresh_page()
 
+    def toggle_cluster_mode(self):
+        if self.list_mode:
+            page_keys = self.ordered_keys[self.current_page * self.entries_per_page:
+                                          (self.current_page + 1) * self.entries_per_page]
+            self.save_current_page(page_keys)
+        else:
+            self.save_current_page()
+
+        self.cluster_mode = not self.cluster_mode
+        self.cluster_originals.clear()
+        self.apply_filter()
+
+    def build_clusters(self):
+        start = time.perf_counter()
+        self.clusters.clear()
+        self.cluster_totals.clear()
+        self.cluster_manual.clear()
+        self.cluster_failed.clear()
+        self.cluster_originals.clear()
+        for groups in cluster_keys(self.deduped_map):
+            members = [k for group in groups for k in group]
+            members.sort(key=lambda k: (-len(self.reverse_map[k]), self.reverse_map[k][0]))
+            rep = members[0]
+            # Only members identical to the representative apart from its numbers/tags
+            # take the template, fuzzy matches are shown but left for manual editing
+            pattern = template_pattern(rep)
+            self.clusters[rep] = members
+            self.cluster_totals[rep] = sum(len(self.reverse_map[k]) for k in members)
+            self.cluster_manual[rep] = {k for k in members if template_pattern(k) != pattern}
+        logging.info(f"Clustered {len(self.deduped_map)} entries into {len(self.clusters)} clusters "
+                     f"in {time.perf_counter() - start:.2f}s")
+
+    def cluster_info(self, key):
+        info = f"cluster of {len(self.clusters[key])}, {self.cluster_totals[key]}x"
+        manual = len(self.cluster_manual[key]) + len(self.cluster_failed.get(key, ()))
+        return f"{info}, {manual} not auto-updated" if manual else info
+
+    def update_entry(self, key, value):
+        if self.deduped_map[key] == value:
+            return
+        self.deduped_map[key] = value
+        if self.cluster_mode and key in self.clusters:
+            self.apply_cluster_template(key)
+
+    def apply_cluster_template(self, key):
+        template = self.deduped_map[key]
+        manual = self.cluster_manual[key]
+        failed = self.cluster_failed[key] = set()
+        for member in self.clusters[key]:
+            if member == key or member in manual:
+                continue
+            filled = fill_template(template, key, member)
+            if filled is None:
+                # Undo earlier fills from this session, e.g. while the edit was half typed
+                failed.add(member)
+                if member in self.cluster_originals:
+                    self.deduped_map[member] = self.cluster_originals.pop(member)
+            else:
+                self.cluster_originals.setdefault(member, self.deduped_map[member])
+                self.deduped_map[member] = filled
+
     def next_page(self):
         if self.list_mode:
             page_keys = self.ordered_keys[self.current_page * self.entries_per_page:
@@ -538,14 +881,14 @@ class CSVTranslationTool:
         try:
             if self.list_mode and self.list_widget and page_keys:
                 content = self.list_widget.get("1.0", tk.END).strip()
-                pattern = r'^____Entry \d+(?: ⚠ \([^)]+\))?:$'
+                pattern = r'^____Entry \d+(?: \(cluster of [^)]+\))?(?: ⚠ \([^)]+\))?:$'
                 split_entries = re.split(pattern, content, flags=re.MULTILINE)[1:]
                 matches = re.findall(pattern, content, flags=re.MULTILINE)
 
                 if len(split_entries) == len(page_keys):
                     for key, val in zip(page_keys, split_entries):
                         cleaned = val.strip()
-                        self.deduped_map[key] = cleaned
+                        self.update_entry(key, cleaned)
                         issues = self.check_text_limits(cleaned)
                         if issues:
                             logging.warning(f"Entry {key} issues: {issues}")
@@ -555,7 +898,7 @@ class CSVTranslationTool:
                     logging.debug(f"Raw content preview:\n{content[:500]}")
             else:
                 for key, widget in self.text_widgets.items():
-                    self.deduped_map[key] = widget.get("1.0", tk.END).strip()
+                    self.update_entry(key, widget.get("1.0", tk.END).strip())
 
             self.autosave_temp()
 
@@ -587,6 +930,11 @@ class CSVTranslationTool:
 
         self.deduped_map.clear()
         self.reverse_map.clear()
+        self.clusters.clear()
+        self.cluster_totals.clear()
+        self.cluster_manual.clear()
+        self.cluster_failed.clear()
+        self.cluster_originals.clear()
 
         DUMMY_KEYWORDS = {"dummy", "ダミー", "ダミー。", "※開発用"}
 
@@ -606,8 +954,14 @@ class CSVTranslationTool:
             self.min_duplicates_filter = int(self.filter_entry.get())
         except ValueError:
             self.min_duplicates_filter = 0
-        self.ordered_keys = [k for k in self.deduped_map if len(self.reverse_map[k]) >= self.min_duplicates_filter]
-        self.ordered_keys.sort(key=lambda k: len(self.reverse_map[k]), reverse=self.sort_descending)
+        if self.cluster_mode:
+            if self.deduped_map and not self.clusters:
+                self.build_clusters()
+            counts = self.cluster_totals
+        else:
+            counts = {k: len(v) for k, v in self.reverse_map.items()}
+        self.ordered_keys = [k for k in counts if counts[k] >= self.min_duplicates_filter]
+        self.ordered_keys.sort(key=lambda k: counts[k], reverse=self.sort_descending)
         self.current_page = 0
         self.refresh_page()
 
@@ -663,6 +1017,70 @@ class CSVTranslationTool:
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {e}")
 
+    def iter_export_entries(self):
+        for key, value in self.deduped_map.items():
+            occurrences = [(idx, self.data[idx].get('location', '')) for idx in self.reverse_map[key]]
+            yield key, value, occurrences
+
+    def export_translations(self, fmt):
+        label, ext, writer, _ = EXCHANGE_FORMATS[fmt]
+        if not self.deduped_map:
+            messagebox.showwarning("Export", "Load a CSV before exporting.")
+            return
+        if self.list_mode:
+            page_keys = self.ordered_keys[self.current_page * self.entries_per_page:
+                                          (self.current_page + 1) * self.entries_per_page]
+            self.save_current_page(page_keys)
+        else:
+            self.save_current_page()
+
+        path = filedialog.asksaveasfilename(defaultextension=ext, filetypes=[(label, f"*{ext}")])
+        if not path:
+            return
+        try:
+            count = writer(path, self.iter_export_entries())
+            messagebox.showinfo("Export", f"Exported {count} entries to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {e}")
+
+    def import_translations(self, fmt):
+        label, ext, _, reader = EXCHANGE_FORMATS[fmt]
+        if not self.deduped_map:
+            messagebox.showwarning("Import", "Load the matching CSV before importing.")
+            return
+        path = filedialog.askopenfilename(filetypes=[(label, f"*{ext}")])
+        if not path:
+            return
+        if self.list_mode:
+            page_keys = self.ordered_keys[self.current_page * self.entries_per_page:
+                                          (self.current_page + 1) * self.entries_per_page]
+            self.save_current_page(page_keys)
+        else:
+            self.save_current_page()
+
+        updates, skipped, untranslated = {}, 0, 0
+        try:
+            for source, target in reader(path):
+                if source not in self.deduped_map:
+                    skipped += 1
+                elif not target:
+                    # An empty target means untranslated in PO/XLIFF, keep the current text
+                    untranslated += 1
+                else:
+                    updates[source] = target
+        except Exception as e:
+            messagebox.showerror("Error", f"Import failed, nothing was changed: {e}")
+            return
+
+        self.deduped_map.update(updates)
+        if skipped:
+            logging.warning(f"Import skipped {skipped} entries with no matching source text")
+        messagebox.showinfo("Import", f"Updated {len(updates)} entries ({untranslated} untranslated left unchanged, "
+                                      f"{skipped} not found in loaded CSV)")
+
+        self.autosave_temp()
+        self.refresh_page()
+
     def reload_theme(self):
         self.load_theme()
         self.refresh_page()